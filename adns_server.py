@@ -16,16 +16,22 @@ import syslog
 import struct
 import socket
 import atexit
-import select
+import selectors
 import threading
+import concurrent.futures
 import signal
 import hashlib
 import base64
 import time
 import enum
 import random
+import functools
 import binascii
 import yaml
+try:
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:
+    from yaml import SafeLoader as YamlLoader
 import siphash
 import cachetools
 
@@ -39,6 +45,7 @@ import dns.rdataclass
 import dns.query
 import dns.opcode
 import dns.edns
+import dns.renderer
 import dns.dnssec
 from dns.rdtypes.ANY import NSEC
 from dns.rdtypes.ANY import NSEC3
@@ -65,6 +72,12 @@ CACHE_TTL = RRSIG_LIFETIME - 2 * (RRSIG_INCEPTION_OFFSET)
 COOKIE_TIMESTAMP_DRIFT = 86400        # Allowed DNS Cookie timestamp drift (secs)
 COOKIE_RECALCULATE_TIME = 21600
 
+# Response wire cache parameters
+RESPONSE_CACHE_SIZE = 4096
+
+# Interned qname cache parameters
+QNAME_CACHE_SIZE = 4096
+
 class RRtype(enum.IntEnum):
     """Resource Record types"""
     NXNAME = 128
@@ -109,6 +122,7 @@ class Preferences:
     edns_udp_adv = 1232               # Max EDNS UDP payload we advertise
     nsid = None                       # NSID option string
     minimal_any = False               # Minimal ANY (RFC 8482)
+    processes = 1                     # Number of worker processes to fork
     cookie_secret = None              # Secret for DNS cookie generation
     cache_stats = False               # Print online signature cache statistics
 
@@ -151,8 +165,8 @@ must be present.
 def init_config(prefs, zonedict, only_zones=False):
     """Initialize parameters and zone files from config file"""
 
-    with open(prefs.config, 'r', encoding="utf-8") as configfile:
-        ydoc = yaml.safe_load(configfile)
+    with open(prefs.config, 'rb') as configfile:
+        ydoc = yaml.load(configfile, Loader=YamlLoader)
 
     if not only_zones:
         if "config" in ydoc:
@@ -173,6 +187,8 @@ def init_config(prefs, zonedict, only_zones=False):
                     prefs.nsid = val.encode()
                 elif key == 'minimal_any':
                     prefs.minimal_any = val
+                elif key == 'processes':
+                    prefs.processes = val or os.cpu_count()
                 elif key == "cache_stats":
                     prefs.cache_stats = val
                 else:
@@ -300,12 +316,28 @@ def handle_sighup(signum, frame):
     log_message('control: caught SIGHUP .. re-reading config and zones.')
     sign_rrset.cache.clear()
     init_config(PREFS, ZONEDICT)
+    # Clear only after the reload: workers keep answering from the old
+    # zone data while init_config runs, and anything they cached after
+    # an earlier clear would be served stale for up to CACHE_TTL.
+    with RESPONSE_CACHE_LOCK:
+        RESPONSE_CACHE.clear()
+    for workerpid in WORKER_PIDS:
+        try:
+            os.kill(workerpid, signal.SIGHUP)
+        except ProcessLookupError:
+            pass
 
 
 def handle_sigterm(signum, frame):
-    """handle SIGTERM - exit program"""
+    """handle SIGTERM - terminate forked workers and exit program"""
     _, _ = signum, frame
     log_message('control: caught SIGTERM .. exiting.')
+    for workerpid in WORKER_PIDS:
+        try:
+            os.kill(workerpid, signal.SIGTERM)
+            os.waitpid(workerpid, 0)
+        except (ProcessLookupError, ChildProcessError):
+            pass
     sys.exit(0)
 
 
@@ -357,15 +389,14 @@ def daemon(dirname=None, syslog_fac=syslog.LOG_DAEMON):
         print(f"fork() #2 failed: {einfo:s}")
         sys.exit(1)
 
+    mypid = os.getpid()
     with open(pidfile, 'w', encoding="utf-8") as pid_f:
-        pid_f.write(f'{os.getpid()}\n')
-    atexit.register(lambda: os.remove(pidfile))
+        pid_f.write(f'{mypid}\n')
+    # Only the process that wrote the pidfile removes it; forked
+    # workers inherit this handler and must not delete it on exit.
+    atexit.register(lambda: os.remove(pidfile) if os.getpid() == mypid else None)
 
-    for file_desc in range(0, os.sysconf("SC_OPEN_MAX")):
-        try:
-            os.close(file_desc)
-        except OSError:
-            pass
+    os.closerange(0, os.sysconf("SC_OPEN_MAX"))
 
     syslog.openlog(PROGNAME, syslog.LOG_PID, syslog_fac)
 
@@ -390,6 +421,7 @@ def drop_privs(uname, gname):
 def udp4socket(host, port):
     """Create IPv4 UDP server socket"""
     sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
     sock.bind((host, port))
     return sock
 
@@ -398,6 +430,7 @@ def udp6socket(host, port):
     """Create IPv6 UDP server socket"""
     sock = socket.socket(socket.AF_INET6, socket.SOCK_DGRAM)
     sock.setsockopt(socket.IPPROTO_IPV6, socket.IPV6_V6ONLY, 1)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
     sock.bind((host, port))
     return sock
 
@@ -406,6 +439,7 @@ def tcp4socket(host, port):
     """Create IPv4 TCP server socket"""
     sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
     sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
     sock.bind((host, port))
     sock.listen(5)
     return sock
@@ -416,6 +450,7 @@ def tcp6socket(host, port):
     sock = socket.socket(socket.AF_INET6, socket.SOCK_STREAM)
     sock.setsockopt(socket.IPPROTO_IPV6, socket.IPV6_V6ONLY, 1)
     sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
     sock.bind((host, port))
     sock.listen(5)
     return sock
@@ -423,10 +458,11 @@ def tcp6socket(host, port):
 
 def send_socket(sock, message):
     """Send message on a connected socket"""
+    view = memoryview(message)
     try:
         octets_sent = 0
         while octets_sent < len(message):
-            sentn = sock.send(message[octets_sent:])
+            sentn = sock.send(view[octets_sent:])
             if sentn == 0:
                 log_message("error: send() returned 0 bytes")
                 raise ValueError("send() returned 0 bytes")
@@ -439,16 +475,15 @@ def send_socket(sock, message):
 
 def recv_socket(sock, num_octets):
     """Read and return num_octets of data from a connected socket"""
-    response = ""
+    buf = bytearray(num_octets)
+    view = memoryview(buf)
     octets_read = 0
     while octets_read < num_octets:
-        chunk = sock.recv(num_octets - octets_read)
-        chunklen = len(chunk)
+        chunklen = sock.recv_into(view[octets_read:])
         if chunklen == 0:
-            return ""
+            return b""
         octets_read += chunklen
-        response += chunk
-    return response
+    return bytes(buf)
 
 
 def load_private_key(keyfile):
@@ -506,6 +541,8 @@ class Zone(dns.zone.Zone):
 
     __slots__ = [
         'ent_nodes',
+        'wildcard_parents',
+        'neg_soa_rrset',
         'dnssec',
         'privatekey',
         'signing_dnskey',
@@ -522,7 +559,8 @@ class Zone(dns.zone.Zone):
 
         super().__init__(origin, rdclass, relativize=relativize)
         self.nodes = self.map_factory()
-        self.ent_nodes = {}
+        self.ent_nodes = set()
+        self.wildcard_parents = set()
         self.dnssec = False
         self.privatekey = None
         self.signing_dnskey = None
@@ -533,10 +571,29 @@ class Zone(dns.zone.Zone):
         self.keytag = None
         self.nsec3param = None
         self.soa_min_ttl = None
+        self.neg_soa_rrset = None
 
     def __hash__(self):
         return hash((self.origin, self.rdclass))
 
+    def reset_config_state(self):
+        """
+        Reset config-derived attributes to their defaults. Called when
+        a cached zone is reused across a config reload, so state from
+        the previous config (e.g. a since-removed dnssec or
+        dynamic_signing setting) doesn't leak through; make_single_zone
+        then reapplies whatever the current config specifies.
+        """
+        self.dnssec = False
+        self.privatekey = None
+        self.signing_dnskey = None
+        self.keytag = None
+        self.nsec3param = None
+        self.compact_denial = False
+        self.deleg_enabled = False
+        self.udp_truncate_all = False
+        self.require_server_cookie = False
+
     def init_dnssec(self):
         """set DNSSEC parameters"""
 
@@ -554,30 +611,45 @@ class Zone(dns.zone.Zone):
         self.keytag = dns.dnssec.key_id(self.signing_dnskey)
 
     def set_soa_min_ttl(self):
-        """Calculate SOA min TTL value"""
+        """Calculate SOA min TTL value and negative-response SOA RRset"""
         soa_rrset = self.get_rrset(self.origin, dns.rdatatype.SOA)
         self.soa_min_ttl = min(soa_rrset.ttl, soa_rrset[0].minimum)
+        self.neg_soa_rrset = dns.rrset.RRset(self.origin,
+                                             dns.rdataclass.IN,
+                                             dns.rdatatype.SOA)
+        self.neg_soa_rrset.update(soa_rrset)
+        self.neg_soa_rrset.ttl = self.soa_min_ttl
 
     def online_signing(self):
         """Does this zone utilize online signing?"""
         return self.dnssec and (self.privatekey is not None)
 
     def get_ent_nodes(self):
-        """Find all empty non-terminals in the zone"""
+        """
+        Find all empty non-terminals in the zone. Builds a label trie
+        of all names below the origin in a single pass; the interior
+        trie entries that have no explicit node in the zone are the
+        empty non-terminals.
+        """
 
-        seen = {}
+        trie = {}
         for name in self.keys():
             if name == self.origin:
                 continue
-            current_name = name
-            while current_name not in seen:
-                seen[current_name] = 1
-                parent = current_name.parent()
-                if parent == self.origin:
-                    break
-                if self.get_node(parent) is None:
-                    self.ent_nodes[parent] = 1
-                current_name = parent
+            subtrie = trie
+            for label in reversed(name.relativize(self.origin).labels):
+                subtrie = subtrie.setdefault(label, {})
+
+        stack = [(trie, self.origin.labels)]
+        while stack:
+            subtrie, parent_labels = stack.pop()
+            for label, children in subtrie.items():
+                if not children:
+                    continue
+                name = dns.name.Name((label,) + parent_labels)
+                if self.get_node(name) is None:
+                    self.ent_nodes.add(name)
+                stack.append((children, name.labels))
 
     def add_ent_nodes(self):
         """Add all empty non-terminals as explicits nodes in the Dict"""
@@ -587,6 +659,12 @@ class Zone(dns.zone.Zone):
             node = self.node_factory()
             self.nodes[entry] = node
 
+    def set_wildcard_parents(self):
+        """Record the parents of wildcard names for quick existence tests"""
+
+        self.wildcard_parents = {name.parent() for name in self.keys()
+                                 if name.labels[0] == b'*'}
+
     def nsec_matching(self, name):
         """Return NSEC RRset matching the name"""
 
@@ -651,15 +729,32 @@ class Zone(dns.zone.Zone):
         return f"<Zone: {self.origin}>"
 
 
+ZONE_FILE_CACHE = {}                  # zonefile -> (name, mtime, size, Zone)
+
+
 def zone_from_file(name, zonefile):
-    """Obtain Zone object from zone name and file"""
+    """
+    Obtain Zone object from zone name and file. Parsed zones are cached
+    keyed by the file's (mtime, size), so a SIGHUP reload only pays the
+    parsing cost for zone files that actually changed.
+    """
+
+    statinfo = os.stat(zonefile)
+    cached = ZONE_FILE_CACHE.get(zonefile)
+    if cached and cached[:3] == (name, statinfo.st_mtime, statinfo.st_size):
+        zone = cached[3]
+        zone.reset_config_state()
+        return zone
 
     zone = dns.zone.from_file(zonefile, origin=name, zone_factory=Zone,
                               relativize=False)
     if not isinstance(zone.nodes, zone.map_factory):
         zone.nodes = zone.map_factory(zone.nodes)
     zone.add_ent_nodes()
+    zone.set_wildcard_parents()
     zone.set_soa_min_ttl()
+    ZONE_FILE_CACHE[zonefile] = (name, statinfo.st_mtime, statinfo.st_size,
+                                 zone)
     return zone
 
 
@@ -683,11 +778,20 @@ class ZoneDict:
         self.data[zonename] = zone
 
     def find(self, qname):
-        """Return closest enclosing zone object for the qname"""
-        for zname in self.zonelist:
-            if qname.is_subdomain(zname):
-                return self.data[zname]
-        return None
+        """
+        Return closest enclosing zone object for the qname. Walks from
+        the qname upward toward the root, testing each ancestor name
+        against the dictionary of zone origins, so the lookup cost is
+        bounded by the qname's label count.
+        """
+        name = qname
+        while True:
+            zone = self.data.get(name)
+            if zone is not None:
+                return zone
+            if name == dns.name.root:
+                return None
+            name = name.parent()
 
 
 B32_TO_EXT_HEX = bytes.maketrans(b'ABCDEFGHIJKLMNOPQRSTUVWXYZ234567',
@@ -721,11 +825,6 @@ def nsec3hash(name, algnum, wire_salt, iterations, binary_out=False):
     return output
 
 
-def query_meta_type(qtype):
-    """Is given query type a meta type (except ANY)?"""
-    return 128 <= qtype <= 254
-
-
 def compact_answer_ok(message):
     """Does DNS message have Compact Answers OK EDNS header flag set?"""
     return message.ednsflags & EdnsFlag.COMPACT_OK == EdnsFlag.COMPACT_OK
@@ -826,6 +925,35 @@ def make_nsec3_rrset_minimal(params, zone, owner, rrtypes, ttl, covering=False):
                             ttl)
 
 
+@functools.lru_cache(maxsize=None)
+def rdtype_to_text(rdtype):
+    """Memoized dns.rdatatype.to_text; a handful of types dominate"""
+    return dns.rdatatype.to_text(rdtype)
+
+
+@functools.lru_cache(maxsize=None)
+def rdclass_to_text(rdclass):
+    """Memoized dns.rdataclass.to_text"""
+    return dns.rdataclass.to_text(rdclass)
+
+
+QNAME_CACHE = cachetools.LRUCache(maxsize=QNAME_CACHE_SIZE)
+QNAME_CACHE_LOCK = threading.Lock()
+
+
+def intern_qname(qname):
+    """
+    Intern qname so that repeated queries for the same name share one
+    Name object, reducing allocation churn and letting downstream
+    hash-keyed lookups hit an already-hashed object. The cache is
+    keyed by the exact label bytes rather than the Name itself, since
+    Name compares case-insensitively and the query's case must be
+    preserved (0x20 case randomization echoes it back verbatim).
+    """
+    with QNAME_CACHE_LOCK:
+        return QNAME_CACHE.setdefault(qname.labels, qname)
+
+
 class DNSquery:
     """DNS query object"""
 
@@ -855,7 +983,7 @@ class DNSquery:
             if not self.message.question:
                 self.headeronly = True
             else:
-                self.qname = self.message.question[0].name
+                self.qname = intern_qname(self.message.question[0].name)
                 self.qtype = self.message.question[0].rdtype
                 self.qclass = self.message.question[0].rdclass
             self.log_query()
@@ -882,8 +1010,8 @@ class DNSquery:
         else:
             msg = (f'{opcode}: {transport} '
                    f'{self.qname} '
-                   f'{dns.rdatatype.to_text(self.qtype)} '
-                   f'{dns.rdataclass.to_text(self.qclass)} '
+                   f'{rdtype_to_text(self.qtype)} '
+                   f'{rdclass_to_text(self.qclass)} '
                    f'from: {self.cliaddr},{self.cliport} size={self.msg_len}')
         edns_log_message = self.edns_log_info()
         if edns_log_message:
@@ -925,9 +1053,8 @@ class DNSresponse:
         if self.need_to_truncate:
             return self.truncate()
 
-        payload_max = self.max_size()
         try:
-            wire = self.response.to_wire(max_size=payload_max)
+            wire = self.render_wire(self.max_size())
         except dns.exception.TooBig:
             wire = self.truncate()
         if self.query.tcp:
@@ -935,6 +1062,32 @@ class DNSresponse:
             wire = msglen + wire
         return wire
 
+    def render_wire(self, payload_max):
+        """
+        Render the response into wire format in a single pass using
+        dns.renderer.Renderer directly, bypassing the generic
+        bookkeeping in dns.message.Message.to_wire. Raises
+        dns.exception.TooBig if the message doesn't fit in payload_max.
+        """
+
+        message = self.response
+        renderer = dns.renderer.Renderer(id=message.id,
+                                         flags=message.flags,
+                                         max_size=payload_max)
+        for rrset in message.question:
+            renderer.add_question(rrset.name, rrset.rdtype, rrset.rdclass)
+        for rrset in message.answer:
+            renderer.add_rrset(dns.renderer.ANSWER, rrset)
+        for rrset in message.authority:
+            renderer.add_rrset(dns.renderer.AUTHORITY, rrset)
+        if message.edns >= 0:
+            renderer.add_edns(message.edns, message.ednsflags,
+                              message.payload, message.options)
+        for rrset in message.additional:
+            renderer.add_rrset(dns.renderer.ADDITIONAL, rrset)
+        renderer.write_header()
+        return renderer.get_wire()
+
     def max_size(self):
         """Compute maximum permissible DNS response size"""
 
@@ -942,16 +1095,19 @@ class DNSresponse:
             return 65533
         if (PREFS.edns_udp_max == 0) or (self.query.message.edns == -1):
             return 512
-        return min(self.query.message.payload, PREFS.edns_udp_max)
+        # Clamp to the RFC 6891 512-octet floor; clients may advertise
+        # a smaller (or zero) payload, which must not shrink the limit
+        return max(512, min(self.query.message.payload, PREFS.edns_udp_max))
 
     def truncate(self):
         """Truncate response message"""
 
-        self.response.flags |= dns.flags.TC
-        self.response.answer = []
-        self.response.authority = []
-        self.response.additional = []
-        return self.response.to_wire()
+        response = self.response
+        response.flags |= dns.flags.TC
+        del response.answer[:]
+        del response.authority[:]
+        del response.additional[:]
+        return response.to_wire()
 
     def add_rrset(self, zobj, section, rrset, wildcard=None, authoritative=True):
         """Add RRset to section, fetching RRsigs if needed"""
@@ -983,9 +1139,7 @@ class DNSresponse:
     def add_soa(self, zobj):
         """Add SOA record to authority for negative responses"""
 
-        soa_rrset = zobj.get_rrset(zobj.origin, dns.rdatatype.SOA)
-        self.add_rrset(zobj, self.response.authority, soa_rrset)
-        soa_rrset.ttl = zobj.soa_min_ttl
+        self.add_rrset(zobj, self.response.authority, zobj.neg_soa_rrset)
 
     def nxdomain(self, zobj, sname):
         """Generate NXDOMAIN response"""
@@ -1447,9 +1601,10 @@ class DNSresponse:
 
         node = zobj.get_node(sname)
         if node is None:
-            # Look for wildcard
-            wildcard_name = dns.name.Name((b'*',) + sname.labels[1:])
-            if zobj.get_node(wildcard_name) is not None:
+            # Look for wildcard; only construct the wildcard name if
+            # this parent actually hosts one
+            if sname.parent() in zobj.wildcard_parents:
+                wildcard_name = dns.name.Name((b'*',) + sname.labels[1:])
                 self.find_rrtype(zobj, wildcard_name, stype, wildcard=sname)
                 if not zobj.online_signing():
                     self.wildcard_no_closer_match(zobj, wildcard_name, sname)
@@ -1491,16 +1646,19 @@ class DNSresponse:
         wildcard, dname, or delegation.
         """
 
+        name_class = dns.name.Name
+        process_name = self.process_name
         zone_name = zobj.origin
-        label_list = list(qname.relativize(zone_name).labels)
+        rel_labels = qname.relativize(zone_name).labels
+        index = len(rel_labels)
 
         current_name = zone_name
         while True:
-            finished = self.process_name(zobj, qname, current_name, qtype)
-            if finished or (not label_list):
+            finished = process_name(zobj, qname, current_name, qtype)
+            if finished or index == 0:
                 break
-            label = label_list.pop()
-            current_name = dns.name.Name((label,) + current_name.labels)
+            index -= 1
+            current_name = name_class((rel_labels[index],) + current_name.labels)
 
     def find_answer(self, qname, qtype):
         """Find answer for name and type"""
@@ -1680,7 +1838,9 @@ class DNSresponse:
                 self.response.set_rcode(dns.rcode.REFUSED)
                 return
 
-            if query_meta_type(self.qtype):
+            # Meta query type other than ANY? (range check inlined;
+            # this runs on every query)
+            if 128 <= self.qtype <= 254:
                 self.response.set_rcode(dns.rcode.FORMERR)
                 if self.query.message.edns != -1:
                     option = dns.edns.EDEOption(EDECode.INVALID_QTYPE,
@@ -1701,27 +1861,93 @@ class DNSresponse:
                 self.response.flags |= dns.flags.AA
 
 
+RESPONSE_CACHE = cachetools.TTLCache(maxsize=RESPONSE_CACHE_SIZE,
+                                     ttl=CACHE_TTL)
+RESPONSE_CACHE_LOCK = threading.Lock()
+
+
+def response_cache_key(query):
+    """
+    Return response cache key for query, or None if the query isn't
+    cacheable. Responses are deterministic functions of the question,
+    flags and EDNS parameters between zone reloads, except when the
+    query carries EDNS options (e.g. Cookies), which make the response
+    client-specific. The qname is keyed by its exact label bytes, not
+    the Name object: Name compares case-insensitively, but the cached
+    wire echoes one specific case of the question, and resolvers doing
+    0x20 case randomization verify that echo byte-for-byte.
+    """
+
+    if query.headeronly:
+        return None
+    message = query.message
+    if message.opcode() != dns.opcode.QUERY:
+        return None
+    if message.options:
+        return None
+    return (message.question[0].name.labels, query.qtype, query.qclass,
+            message.flags, message.ednsflags, message.edns,
+            message.payload, query.tcp)
+
+
+def patch_query_id(wire, query):
+    """Return copy of cached response wire with the query's ID patched in"""
+
+    buf = bytearray(wire)
+    struct.pack_into('!H', buf, 2 if query.tcp else 0, query.message.id)
+    return bytes(buf)
+
+
 def handle_query(query, sock):
     """Handle incoming query"""
 
     if not query.message:
         return
 
-    response = DNSresponse(query)
-    if not response.response:
-        return
+    cache_key = response_cache_key(query)
+    if cache_key is not None:
+        with RESPONSE_CACHE_LOCK:
+            cached_wire = RESPONSE_CACHE.get(cache_key)
+        if cached_wire is not None:
+            wire = patch_query_id(cached_wire, query)
+        else:
+            response = DNSresponse(query)
+            if not response.response:
+                return
+            wire = response.to_wire()
+            with RESPONSE_CACHE_LOCK:
+                RESPONSE_CACHE[cache_key] = wire
+    else:
+        response = DNSresponse(query)
+        if not response.response:
+            return
+        wire = response.to_wire()
 
     if query.tcp:
-        send_socket(sock, response.to_wire())
+        send_socket(sock, wire)
     else:
-        sock.sendto(response.to_wire(),
-                    (query.cliaddr, query.cliport))
+        sock.sendto(wire, (query.cliaddr, query.cliport))
+
 
+def wire_prefilter(data):
+    """
+    Cheap sanity check on a query wire message before the full
+    dnspython parse: minimum header length, QR bit clear (it claims to
+    be a query), and at most one question. Header-only messages
+    (qdcount 0, used by DNS Cookie probes) are allowed through.
+    """
+
+    if len(data) < 12:
+        return False
+    flags, qdcount = struct.unpack_from('!HH', data, 2)
+    if flags & 0x8000:
+        return False
+    return qdcount <= 1
 
-def handle_connection_udp(sock, rbufsize=2048):
-    """Handle UDP connection"""
 
-    data, addrport = sock.recvfrom(rbufsize)
+def handle_udp_message(sock, data, addrport):
+    """Handle single UDP message"""
+
     cliaddr, cliport = addrport[0:2]
     if PREFS.debug:
         log_message(f"connect: UDP from ({cliaddr}, {cliport}) "
@@ -1746,26 +1972,56 @@ def handle_connection_tcp(sock, addr, rbufsize=2048):
 def setup_sockets(family, server, port):
     """Setup sockets for connection types and address families we handle"""
 
-    fd_read = []
-    dispatch = {} # dict: socket -> (handler, is_tcp)
+    selector = selectors.DefaultSelector()
 
+    # Both socket types are non-blocking: pre-forked workers share the
+    # listeners, so readiness in one worker doesn't guarantee this
+    # worker's accept()/recvfrom() won't block.
     if family is None or family == 'IPv4':
         s_udp4 = udp4socket(server, port)
-        fd_read.append(s_udp4.fileno())
-        dispatch[s_udp4] = (handle_connection_udp, False)
+        s_udp4.setblocking(False)
+        selector.register(s_udp4, selectors.EVENT_READ,
+                          data=(handle_udp_message, False))
         s_tcp4 = tcp4socket(server, port)
-        fd_read.append(s_tcp4.fileno())
-        dispatch[s_tcp4] = (handle_connection_tcp, True)
+        s_tcp4.setblocking(False)
+        selector.register(s_tcp4, selectors.EVENT_READ,
+                          data=(handle_connection_tcp, True))
 
     if family is None or family == 'IPv6':
         s_udp6 = udp6socket(server, port)
-        fd_read.append(s_udp6.fileno())
-        dispatch[s_udp6] = (handle_connection_udp, False)
+        s_udp6.setblocking(False)
+        selector.register(s_udp6, selectors.EVENT_READ,
+                          data=(handle_udp_message, False))
         s_tcp6 = tcp6socket(server, port)
-        fd_read.append(s_tcp6.fileno())
-        dispatch[s_tcp6] = (handle_connection_tcp, True)
+        s_tcp6.setblocking(False)
+        selector.register(s_tcp6, selectors.EVENT_READ,
+                          data=(handle_connection_tcp, True))
+
+    return selector
+
 
-    return fd_read, dispatch
+WORKER_PIDS = []                      # forked worker pids (parent only)
+
+
+def fork_workers(nprocs):
+    """
+    Pre-fork additional worker processes, each running its own event
+    loop on the shared bound sockets. The kernel distributes incoming
+    datagrams and connections across the workers, so query processing
+    scales past a single interpreter's GIL. The parent records the
+    worker pids so handle_sighup can forward SIGHUP to them.
+    """
+
+    for _ in range(nprocs - 1):
+        try:
+            pid = os.fork()
+        except OSError as einfo:
+            log_message(f"error: fork() of worker failed: {einfo}")
+            return
+        if pid == 0:
+            del WORKER_PIDS[:]
+            return
+        WORKER_PIDS.append(pid)
 
 
 def setup_server():
@@ -1779,39 +2035,86 @@ def setup_server():
     log_message(f"info: {PROGNAME} version {__version__}: running")
 
     try:
-        fd_read, dispatch = setup_sockets(PREFS.server_af,
-                                          PREFS.server, PREFS.port)
+        selector = setup_sockets(PREFS.server_af,
+                                 PREFS.server, PREFS.port)
     except PermissionError as exc_info:
         log_fatal(f"Error setting up sockets: {exc_info}")
 
     if PREFS.username or PREFS.groupname:
         drop_privs(PREFS.username, PREFS.groupname)
 
+    if PREFS.processes > 1:
+        fork_workers(PREFS.processes)
+
     log_message(f"info: Listening on UDP and TCP port {PREFS.port}")
-    return fd_read, dispatch
+    return selector
 
 
-def run_event_loop(fd_read, dispatch):
-    """Run main event loop ..."""
+def log_handler_exception(future):
+    """
+    Done-callback for pool-submitted handlers: exceptions raised in a
+    worker would otherwise be swallowed by the discarded future.
+    """
+    exc_info = future.exception()
+    if exc_info is not None:
+        log_message(f"error: handler exception: {type(exc_info)}: {exc_info}")
+
+
+UDP_RECV_BUFSIZE = 2048
+UDP_RECV_BUFFER = bytearray(UDP_RECV_BUFSIZE)
+
+
+def drain_udp(sock, handler, pool):
+    """
+    Read all currently pending datagrams from a UDP socket into a
+    reusable buffer and submit each to the worker pool. Draining the
+    socket amortizes the selector wakeup over a burst of packets; only
+    the datagram-sized payload copy is allocated per packet.
+    """
 
     while True:
         try:
-            (ready_r, _, _) = select.select(fd_read, [], [], 5)
+            nbytes, addrport = sock.recvfrom_into(UDP_RECV_BUFFER)
+        except BlockingIOError:
+            return
         except OSError as exc_info:
-            log_fatal(f"error: from select(): {exc_info}")
-        if not ready_r:
+            log_message(f"error: recvfrom: {exc_info}")
+            return
+        view = memoryview(UDP_RECV_BUFFER)[:nbytes]
+        if not wire_prefilter(view):
             continue
+        future = pool.submit(handler, sock, bytes(view), addrport)
+        future.add_done_callback(log_handler_exception)
+
+
+def run_event_loop(selector):
+    """Run main event loop ..."""
 
-        for file_desc in ready_r:
-            for (sock, (handler, is_tcp)) in dispatch.items():
-                if file_desc == sock.fileno():
-                    if is_tcp:
-                        conn, addr = sock.accept()
-                        threading.Thread(target=handler,
-                                         args=(conn, addr)).start()
-                    else:
-                        threading.Thread(target=handler,
-                                         args=(sock,)).start()
+    pool = concurrent.futures.ThreadPoolExecutor(max_workers=os.cpu_count())
+
+    while True:
+        try:
+            ready = selector.select(timeout=5)
+        except OSError as exc_info:
+            log_fatal(f"error: from selector: {exc_info}")
+
+        for key, _ in ready:
+            handler, is_tcp = key.data
+            sock = key.fileobj
+            if is_tcp:
+                try:
+                    conn, addr = sock.accept()
+                except BlockingIOError:
+                    # Another worker took this connection
+                    continue
+                # Workers do blocking I/O on the accepted connection
+                conn.setblocking(True)
+                # Disable Nagle; DNS responses are small and latency-bound
+                conn.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+                future = pool.submit(handler, conn, addr)
+                future.add_done_callback(log_handler_exception)
+            else:
+                drain_udp(sock, handler, pool)
 
 
 if __name__ == '__main__':
@@ -1820,5 +2123,5 @@ if __name__ == '__main__':
     PREFS = Preferences()
     ZONEDICT = ZoneDict()
     process_args(PREFS, ZONEDICT, sys.argv[1:])
-    FD_READ, DISPATCH = setup_server()
-    run_event_loop(FD_READ, DISPATCH)
+    SELECTOR = setup_server()
+    run_event_loop(SELECTOR)